@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Precompute the page lists into _frozen_pages.py.
+
+The TOML data files are the source of truth; this script bakes the parsed
+pages into a flat module of tuple literals so repeated site builds skip the
+TOML parse entirely. generate_site_pages only uses the frozen module when it
+is newer than both data files and the generator itself (the tuples bake in
+the Page field order), so a stale freeze is ignored, never wrong.
+
+Usage: python3 docs/tools/freeze_pages.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from generate_site_pages import all_theory_pages, all_wiki_pages
+
+OUT = Path(__file__).resolve().parent / "_frozen_pages.py"
+
+
+def _emit(name: str, pages) -> str:
+    lines = [f"{name} = ("]
+    for page in pages:
+        lines.append(f"    {tuple(page)!r},")
+    lines.append(")")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    theory = all_theory_pages()
+    wiki = all_wiki_pages()
+    body = "\n\n".join(
+        (
+            '"""Generated by freeze_pages.py; do not edit. Plain tuples in Page field order."""',
+            _emit("THEORY_PAGES", theory),
+            _emit("WIKI_PAGES", wiki),
+        )
+    )
+    OUT.write_text(body + "\n", encoding="utf-8")
+    print(f"Froze {len(theory)} theory pages and {len(wiki)} wiki pages into {OUT.name}.")
+
+
+if __name__ == "__main__":
+    main()